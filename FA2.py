@@ -12,15 +12,22 @@ import smartpy as sp
 
 
 def bytes_of_nat(params):
+    # Digits are emitted two at a time: `c2` maps 0..99 to zero-padded
+    # 2-byte ASCII, `c` maps 0..9 to a single digit for the leading chunk.
+    # `c2` is used twice below, bind it once so its literal is not inlined
+    # at each use.
     c   = sp.map({x : sp.bytes(hex(x + 48)) for x in range(0, 10)})
+    c2  = sp.compute(sp.map({x : sp.bytes("0x%02x%02x" % (x // 10 + 48, x % 10 + 48)) for x in range(0, 100)}))
     x   = sp.local('x', params)
-    res = sp.local('res', [])
-    sp.if x.value == 0:
-        res.value.push(c[x.value % 10])
-    sp.while 0 < x.value:
-        res.value.push(c[x.value % 10])
-        x.value //= 10
-    return sp.concat(res.value)
+    res = sp.local('res', sp.bytes("0x"))
+    sp.while 100 <= x.value:
+        res.value = c2[x.value % 100] + res.value
+        x.value //= 100
+    sp.if x.value < 10:
+        res.value = c[x.value] + res.value
+    sp.else:
+        res.value = c2[x.value] + res.value
+    return res.value
 ##
 ## ## Meta-Programming Configuration
 ##
@@ -29,10 +36,11 @@ def bytes_of_nat(params):
 class FA2_config:
     def __init__(self,
                  debug_mode                         = False,
-                 readable                           = True,
+                 readable                           = False,
                  force_layouts                      = True,
                  support_operator                   = True,
                  allow_self_transfer                = False,
+                 operators_per_token                = True,
                  price                              = 1000000,
                  max_editions                       = 2,
                  base_uri                       = "https://open-artblocks.herokuapp.com/api/",
@@ -59,6 +67,9 @@ class FA2_config:
         #
         # For the Babylon protocol, one had to use `readable = False`
         # in order to use `PACK` on the keys of the big-map.
+        #
+        # It now defaults to `False`: operator keys are stored packed as
+        # `bytes`, which is cheaper to compare and store than records.
 
         self.force_layouts = force_layouts
         # The specification requires all interface-fronting records
@@ -69,6 +80,8 @@ class FA2_config:
         # The operator entry-points always have to be there, but there is
         # definitely a use-case for having them completely empty (saving
         # storage and gas when `support_operator` is `False).
+        # When `False`, the `operators` big-map is not even part of the
+        # storage and `transfer` only accepts calls from the owner.
 
         self.add_mutez_transfer = True
         # Add an entry point for the administrator to transfer tez potentially
@@ -76,17 +89,28 @@ class FA2_config:
 
         self.allow_self_transfer = allow_self_transfer
         # Authorize call of `transfer` entry_point from self
+
+        self.operators_per_token = operators_per_token
+        # Operators are granted per token, as TZIP-12 clients expect.
+        # When `False`, operators are granted per `(owner, operator)` pair
+        # instead: the `token_id` of `update_operators` requests is ignored
+        # and an operator may transfer every current and future token of
+        # the owner. Granting a marketplace then takes a single big-map
+        # write instead of one per token; the wider scope is advertised
+        # with a custom permission in the contract metadata.
         name = "FA2"
         if debug_mode:
             name += "-debug"
-        if not readable:
-            name += "-no_readable"
+        if readable:
+            name += "-readable"
         if not force_layouts:
             name += "-no_layout"
         if not support_operator:
             name += "-no_ops"
         if allow_self_transfer:
             name += "-self_transfer"
+        if not operators_per_token:
+            name += "-ops_per_owner"
         self.name = name
 
 ## ## Auxiliary Classes and Values
@@ -96,24 +120,30 @@ class FA2_config:
 ##
 token_id_type = sp.TNat
 
-class Error_message:
-    def __init__(self, config):
-        self.config = config
-        self.prefix = "FA2_"
-    def make(self, s): return (self.prefix + s)
-    def token_undefined(self):       return self.make("TOKEN_UNDEFINED")
-    def insufficient_balance(self):  return self.make("INSUFFICIENT_BALANCE")
-    def not_operator(self):          return self.make("NOT_OPERATOR")
-    def not_owner(self):             return self.make("NOT_OWNER")
-    def bad_value(self):             return self.make("BAD_VALUE")
-    def max_editions_reached(self):  return self.make("MAX_EDITIONS_REACHED")
-    def operators_unsupported(self): return self.make("OPERATORS_UNSUPPORTED")
-    def not_admin(self):             return self.make("NOT_ADMIN")
-    def not_admin_or_operator(self): return self.make("NOT_ADMIN_OR_OPERATOR")
-    def paused(self):                return self.make("PAUSED")
-    def locked(self):                return self.make("LOCKED")
-    def bad_amount(self):            return self.make("BAD_QUANTITY")
-    def sale_started(self):          return self.make("SALE_STARTED")
+## Each minted token is stored as a single `(owner, hash)` record keyed by
+## its token-id, so one big-map access yields both fields.
+token_type = sp.TRecord(owner = sp.TAddress, hash = sp.TBytes).layout(("owner", "hash"))
+
+## Token metadata fields shared by every token of the collection, encoded
+## once as bytes literals.
+token_decimals_bytes = sp.utils.bytes_of_string("0")
+token_name_bytes     = sp.utils.bytes_of_string("Blocks on Blocks")
+token_symbol_bytes   = sp.utils.bytes_of_string("BOB")
+
+## Error messages raised by the contract.
+TOKEN_UNDEFINED       = "FA2_TOKEN_UNDEFINED"
+INSUFFICIENT_BALANCE  = "FA2_INSUFFICIENT_BALANCE"
+NOT_OPERATOR          = "FA2_NOT_OPERATOR"
+NOT_OWNER             = "FA2_NOT_OWNER"
+BAD_VALUE             = "FA2_BAD_VALUE"
+MAX_EDITIONS_REACHED  = "FA2_MAX_EDITIONS_REACHED"
+OPERATORS_UNSUPPORTED = "FA2_OPERATORS_UNSUPPORTED"
+NOT_ADMIN             = "FA2_NOT_ADMIN"
+NOT_ADMIN_OR_OPERATOR = "FA2_NOT_ADMIN_OR_OPERATOR"
+PAUSED                = "FA2_PAUSED"
+LOCKED                = "FA2_LOCKED"
+BAD_AMOUNT            = "FA2_BAD_QUANTITY"
+SALE_STARTED          = "FA2_SALE_STARTED"
 
 ## The current type for a batched transfer in the specification is as
 ## follows:
@@ -153,6 +183,8 @@ class Batch_transfer:
         return sp.set_type_expr(v, self.get_transfer_type())
 ##
 ## `Operator_param` defines type types for the `%update_operators` entry-point.
+## When `operators_per_token` is `False`, `token_id` is ignored: the grant
+## (or removal) applies to every token of the owner.
 class Operator_param:
     def __init__(self, config):
         self.config = config
@@ -171,7 +203,8 @@ class Operator_param:
         return sp.set_type_expr(r, self.get_type())
 
 ## The link between operators and the addresses they operate is kept
-## in a *lazy set* of `(owner × operator × token-id)` values.
+## in a *lazy set* of `(owner × operator × token-id)` values, or of
+## `(owner × operator)` values when `operators_per_token` is `False`.
 ##
 ## A lazy set is a big-map whose keys are the elements of the set and
 ## values are all `Unit`.
@@ -179,10 +212,15 @@ class Operator_set:
     def __init__(self, config):
         self.config = config
     def inner_type(self):
-        return sp.TRecord(owner = sp.TAddress,
-                          operator = sp.TAddress,
-                          token_id = token_id_type
-                          ).layout(("owner", ("operator", "token_id")))
+        if self.config.operators_per_token:
+            return sp.TRecord(owner = sp.TAddress,
+                              operator = sp.TAddress,
+                              token_id = token_id_type
+                              ).layout(("owner", ("operator", "token_id")))
+        else:
+            return sp.TRecord(owner = sp.TAddress,
+                              operator = sp.TAddress
+                              ).layout(("owner", "operator"))
     def key_type(self):
         if self.config.readable:
             return self.inner_type()
@@ -191,9 +229,13 @@ class Operator_set:
     def make(self):
         return self.config.my_map(tkey = self.key_type(), tvalue = sp.TUnit)
     def make_key(self, owner, operator, token_id):
-        metakey = sp.record(owner = owner,
-                            operator = operator,
-                            token_id = token_id)
+        if self.config.operators_per_token:
+            metakey = sp.record(owner = owner,
+                                operator = operator,
+                                token_id = token_id)
+        else:
+            metakey = sp.record(owner = owner,
+                                operator = operator)
         metakey = sp.set_type_expr(metakey, self.inner_type())
         if self.config.readable:
             return metakey
@@ -218,10 +260,15 @@ class Balance_of:
                 balance = sp.TNat).layout(("request", "balance")))
     def entry_point_type():
         return sp.TRecord(
-            callback = sp.TContract(Balance_of.response_type()),
+            callback = balance_of_callback_type,
             requests = sp.TList(Balance_of.request_type())
         ).layout(("requests", "callback"))
 
+## The response and callback types are built once and shared by every
+## contract instance.
+balance_of_response_type = Balance_of.response_type()
+balance_of_callback_type = sp.TContract(balance_of_response_type)
+
 class Token_meta_data:
     def __init__(self, config):
         self.config = config
@@ -243,9 +290,9 @@ class Token_id_set:
         self.config = config
     def empty(self):
         return sp.nat(0)
-    def add(self, totalTokens, tokenID):
-        sp.verify(totalTokens == tokenID, message = "Token-IDs should be consecutive")
-        totalTokens.set(tokenID + 1)
+    def set_cardinal(self, totalTokens, cardinal):
+        # Token-ids are consecutive: the set is `[0, cardinal)`.
+        totalTokens.set(cardinal)
     def contains(self, totalTokens, tokenID):
         return (tokenID < totalTokens)
     def cardinal(self, totalTokens):
@@ -280,7 +327,6 @@ def mutez_transfer(contract, params):
 class FA2_core(sp.Contract):
     def __init__(self, config, metadata, **extra_storage):
         self.config = config
-        self.error_message = Error_message(self.config)
         self.operator_set = Operator_set(self.config)
         self.operator_param = Operator_param(self.config)
         self.token_id_set = Token_id_set(self.config)
@@ -291,10 +337,10 @@ class FA2_core(sp.Contract):
             self.transfer_mutez = sp.entry_point(mutez_transfer)
         self.add_flag("initial-cast")
         self.exception_optimization_level = "default-line"
+        if self.config.support_operator:
+            extra_storage["operators"] = self.operator_set.make()
         self.init(
-            ledger = self.config.my_map(tkey = sp.TNat, tvalue = sp.TAddress),
-            hashes = self.config.my_map(tkey = sp.TNat, tvalue = sp.TBytes),
-            operators = self.operator_set.make(),
+            tokens = self.config.my_map(tkey = sp.TNat, tvalue = token_type),
             all_tokens = self.token_id_set.empty(),
             metadata = metadata,
             price = sp.mutez(self.config.price),
@@ -310,30 +356,28 @@ class FA2_core(sp.Contract):
         sp.for transfer in params:
            sp.for tx in transfer.txs:
 
-                sender_verify = (
-                    (transfer.from_ == sp.sender) |
-                    self.operator_set.is_member(self.data.operators,
+                sender_verify = (transfer.from_ == sp.sender)
+                if self.config.support_operator:
+                    sender_verify |= self.operator_set.is_member(self.data.operators,
                         transfer.from_,
                         sp.sender,
                         tx.token_id)
-                )
-                message = self.error_message.not_operator()
+                message = NOT_OPERATOR
 
                 if self.config.allow_self_transfer:
                     sender_verify |= (sp.sender == sp.self_address)
                 sp.verify(sender_verify, message = message)
-                sp.verify(
-                    self.data.hashes.contains(tx.token_id),
-                    message = self.error_message.token_undefined()
-                )
-                sp.verify(tx.amount <= 1, message = self.error_message.insufficient_balance())
+                # Minted tokens always have an owner, so a single lookup
+                # tells both whether the token exists and who owns it.
+                token = sp.compute(self.data.tokens.get_opt(tx.token_id).open_some(message = TOKEN_UNDEFINED))
+                sp.verify(tx.amount <= 1, message = INSUFFICIENT_BALANCE)
 
                 sp.if (tx.amount == 1):
 
                     sp.verify(
-                        (self.data.ledger[tx.token_id] == transfer.from_),
-                        message = self.error_message.insufficient_balance())
-                    self.data.ledger[tx.token_id] = tx.to_
+                        (token.owner == transfer.from_),
+                        message = INSUFFICIENT_BALANCE)
+                    self.data.tokens[tx.token_id] = sp.record(owner = tx.to_, hash = token.hash)
                 sp.else:
                     pass
 
@@ -341,23 +385,18 @@ class FA2_core(sp.Contract):
     def balance_of(self, params):
         sp.set_type(params, Balance_of.entry_point_type())
         def f_process_request(req):
-            sp.verify(self.data.hashes.contains(req.token_id), message = self.error_message.token_undefined())
-            sp.if self.data.ledger[req.token_id] == req.owner:
-                sp.result(
-                    sp.record(
-                        request = sp.record(
-                            owner = sp.set_type_expr(req.owner, sp.TAddress),
-                            token_id = sp.set_type_expr(req.token_id, sp.TNat)),
-                        balance = 1))
-            sp.else:
-                sp.result(
-                    sp.record(
-                        request = sp.record(
-                            owner = sp.set_type_expr(req.owner, sp.TAddress),
-                            token_id = sp.set_type_expr(req.token_id, sp.TNat)),
-                        balance = 0))
+            owner = sp.compute(self.data.tokens.get_opt(req.token_id).open_some(message = TOKEN_UNDEFINED).owner)
+            balance = sp.local("balance", sp.nat(0))
+            sp.if owner == req.owner:
+                balance.value = 1
+            sp.result(
+                sp.record(
+                    request = sp.record(
+                        owner = req.owner,
+                        token_id = req.token_id),
+                    balance = balance.value))
         res = sp.local("responses", params.requests.map(f_process_request))
-        destination = sp.set_type_expr(params.callback, sp.TContract(Balance_of.response_type()))
+        destination = sp.set_type_expr(params.callback, balance_of_callback_type)
         sp.transfer(res.value, sp.mutez(0), destination)
 
     @sp.offchain_view(pure = True)
@@ -368,12 +407,26 @@ class FA2_core(sp.Contract):
                 owner = sp.TAddress,
                 token_id = sp.TNat
             ).layout(("owner", "token_id")))
-        sp.verify(self.data.hashes.contains(req.token_id), message = self.error_message.token_undefined())
-        sp.if self.data.ledger[req.token_id] == req.owner:
+        owner = sp.compute(self.data.tokens.get_opt(req.token_id).open_some(message = TOKEN_UNDEFINED).owner)
+        sp.if owner == req.owner:
             sp.result(1)
         sp.else:
             sp.result(0)
 
+    def _add_operator(self, upd):
+        sp.verify(upd.owner == sp.sender, message = NOT_OWNER)
+        self.operator_set.add(self.data.operators,
+                              upd.owner,
+                              upd.operator,
+                              upd.token_id)
+
+    def _remove_operator(self, upd):
+        sp.verify(upd.owner == sp.sender, message = NOT_OWNER)
+        self.operator_set.remove(self.data.operators,
+                                 upd.owner,
+                                 upd.operator,
+                                 upd.token_id)
+
     @sp.entry_point
     def update_operators(self, params):
         sp.set_type(params, sp.TList(
@@ -386,30 +439,43 @@ class FA2_core(sp.Contract):
             sp.for update in params:
                 with update.match_cases() as arg:
                     with arg.match("add_operator") as upd:
-                        sp.verify(upd.owner == sp.sender, message = self.error_message.not_owner())
-                        self.operator_set.add(self.data.operators,
-                                              upd.owner,
-                                              upd.operator,
-                                              upd.token_id)
+                        self._add_operator(upd)
                     with arg.match("remove_operator") as upd:
-                        sp.verify(upd.owner == sp.sender, message = self.error_message.not_owner())
-                        self.operator_set.remove(self.data.operators,
-                                                 upd.owner,
-                                                 upd.operator,
-                                                 upd.token_id)
+                        self._remove_operator(upd)
         else:
-            sp.failwith(self.error_message.operators_unsupported())
+            sp.failwith(OPERATORS_UNSUPPORTED)
+
+    # `add_operators` and `remove_operators` are non-standard shortcuts for
+    # batches of a single kind of `update_operators` request: they avoid
+    # the variant tag and its dispatch on every element.
+    @sp.entry_point
+    def add_operators(self, params):
+        sp.set_type(params, sp.TList(self.operator_param.get_type()))
+        if self.config.support_operator:
+            sp.for upd in params:
+                self._add_operator(upd)
+        else:
+            sp.failwith(OPERATORS_UNSUPPORTED)
+
+    @sp.entry_point
+    def remove_operators(self, params):
+        sp.set_type(params, sp.TList(self.operator_param.get_type()))
+        if self.config.support_operator:
+            sp.for upd in params:
+                self._remove_operator(upd)
+        else:
+            sp.failwith(OPERATORS_UNSUPPORTED)
 
     @sp.entry_point
     def set_mint_parameters(self, params):
-        sp.verify(self.is_administrator(sp.sender), message = self.error_message.not_admin())
-        sp.verify(self.data.all_tokens <= 1, message = self.error_message.sale_started())
+        sp.verify(self.is_administrator(sp.sender), message = NOT_ADMIN)
+        sp.verify(self.data.all_tokens <= 1, message = SALE_STARTED)
         sp.set_type(
             params, sp.TRecord(
                 price = sp.TMutez,
                 max_editions = sp.TNat
             ).layout(("price", "max_editions")))
-        sp.verify(self.data.all_tokens <= params.max_editions, message = self.error_message.bad_amount())
+        sp.verify(self.data.all_tokens <= params.max_editions, message = BAD_AMOUNT)
         self.data.max_editions = params.max_editions
         self.data.price = params.price
 
@@ -427,7 +493,7 @@ class FA2_administrator(FA2_core):
 
     @sp.entry_point
     def set_administrator(self, params):
-        sp.verify(self.is_administrator(sp.sender), message = self.error_message.not_admin())
+        sp.verify(self.is_administrator(sp.sender), message = NOT_ADMIN)
         self.data.administrator = params
 
 class FA2_pause(FA2_core):
@@ -436,7 +502,7 @@ class FA2_pause(FA2_core):
 
     @sp.entry_point
     def set_pause(self, params):
-        sp.verify(self.is_administrator(sp.sender), message = self.error_message.not_admin())
+        sp.verify(self.is_administrator(sp.sender), message = NOT_ADMIN)
         self.data.paused = params
 
 class FA2_lock(FA2_core):
@@ -445,40 +511,38 @@ class FA2_lock(FA2_core):
 
     @sp.entry_point
     def lock(self):
-        sp.verify(self.is_administrator(sp.sender), message = self.error_message.not_admin())
+        sp.verify(self.is_administrator(sp.sender), message = NOT_ADMIN)
         self.data.locked = sp.bool(True)
 
 class FA2_mint(FA2_core):
     @sp.entry_point
     def mint(self, amount):
         sp.set_type(amount, sp.TInt)
-        sp.verify(amount > 0, message = self.error_message.bad_amount())
+        sp.verify(amount > 0, message = BAD_AMOUNT)
 
-        sp.verify(~ self.is_paused(), message = self.error_message.paused())
+        sp.verify(~ self.is_paused(), message = PAUSED)
 
-        nat_amount = sp.as_nat(amount, message = self.error_message.bad_amount())
-        sp.verify(sp.amount == sp.mul(self.data.price, nat_amount), message = self.error_message.bad_value())
-        sp.verify(self.data.all_tokens + nat_amount <= self.data.max_editions, message = self.error_message.max_editions_reached())
+        nat_amount = sp.compute(sp.as_nat(amount, message = BAD_AMOUNT))
+        sp.verify(sp.amount == sp.mul(self.data.price, nat_amount), message = BAD_VALUE)
+        base = sp.compute(self.data.all_tokens)
+        sp.verify(base + nat_amount <= self.data.max_editions, message = MAX_EDITIONS_REACHED)
 
-        i = sp.compute(amount)
-        sp.while i > 0:
-            token_id = sp.compute(self.data.all_tokens)
-            sp.verify(token_id < self.data.max_editions, message = self.error_message.max_editions_reached())
+        # Token-ids are consecutive and the bound is checked above for the
+        # whole batch, so `all_tokens` is only written once after the loop.
+        seed = sp.compute(sp.pack(sp.record(now=sp.now, s=sp.sender)))
+        sp.for token_id in sp.range(base, base + nat_amount):
+            token_hash = sp.keccak(seed + sp.pack(token_id))
 
-            token_hash = sp.keccak(sp.pack(sp.record(now=sp.now, s=sp.sender, tid=token_id)))
+            self.data.tokens[token_id] = sp.record(owner = sp.sender, hash = token_hash)
 
-            self.data.ledger[token_id] = sp.sender
-            self.data.hashes[token_id] = token_hash
-            self.token_id_set.add(self.data.all_tokens, token_id)
-
-            i.set(i - 1)
+        self.token_id_set.set_cardinal(self.data.all_tokens, base + nat_amount)
 
 
 class FA2_script(FA2_core):
     @sp.entry_point
     def set_script(self, script):
-        sp.verify(~ self.is_locked(), message = self.error_message.locked())
-        sp.verify(self.is_administrator(sp.sender), message = self.error_message.not_admin())
+        sp.verify(~ self.is_locked(), message = LOCKED)
+        sp.verify(self.is_administrator(sp.sender), message = NOT_ADMIN)
         sp.set_type(script, sp.TString)
         self.data.script.set(script)
 
@@ -486,8 +550,8 @@ class FA2_base_uri(FA2_core):
     @sp.entry_point
     def set_base_uri(self, params):
         sp.set_type(params, sp.TBytes)
-        sp.verify(~ self.is_locked(), message = self.error_message.locked())
-        sp.verify(self.is_administrator(sp.sender), message = self.error_message.not_admin())
+        sp.verify(~ self.is_locked(), message = LOCKED)
+        sp.verify(self.is_administrator(sp.sender), message = NOT_ADMIN)
         self.data.base_uri = params
 
 class FA2_token_metadata(FA2_core):
@@ -501,13 +565,13 @@ class FA2_token_metadata(FA2_core):
             """
             sp.set_type(token_id, sp.TNat)
 
-            sp.verify(token_id < self.data.all_tokens, message = self.error_message.token_undefined())
-            token_hash = self.data.hashes[token_id]
+            # The view is evaluated off-chain for free, so the metadata is
+            # built on each call rather than paying for a per-token copy at
+            # mint time.
+            token = sp.compute(self.data.tokens.get_opt(token_id).open_some(message = TOKEN_UNDEFINED))
+            token_hash = token.hash
 
             metadata = FA2.make_metadata(
-                name = "Blocks on Blocks",
-                decimals = 0,
-                symbol= "BOB",
                 token_hash = token_hash,
                 uri = self.data.base_uri + bytes_of_nat(token_id)
             )
@@ -516,15 +580,16 @@ class FA2_token_metadata(FA2_core):
 
         self.token_metadata = sp.offchain_view(pure = True, doc = "Get Token Metadata")(token_metadata)
 
-    def make_metadata(symbol, name, decimals, token_hash, uri):
+    def make_metadata(token_hash, uri):
         "Helper function to build metadata JSON bytes values."
         return (sp.map(l = {
-            # Remember that michelson wants map already in ordered
-            "decimals" : sp.utils.bytes_of_string("%d" % decimals),
-            "name" : sp.utils.bytes_of_string(name),
-            "symbol" : sp.utils.bytes_of_string(symbol),
-            "token_hash" : token_hash,
+            # Remember that michelson wants map already in ordered:
+            # keys are listed in byte-lexicographic order.
             "" : uri,
+            "decimals" : token_decimals_bytes,
+            "name" : token_name_bytes,
+            "symbol" : token_symbol_bytes,
+            "token_hash" : token_hash,
         }))
 
 
@@ -540,15 +605,33 @@ class FA2(FA2_token_metadata, FA2_mint, FA2_administrator, FA2_pause, FA2_lock,
     def does_token_exist(self, tok):
         "Ask whether a token ID is exists."
         sp.set_type(tok, sp.TNat)
-        sp.result(self.data.hashes.contains(tok))
+        sp.result(self.data.tokens.contains(tok))
 
     @sp.offchain_view(pure = True)
     def all_tokens(self):
         sp.result(sp.range(0, self.data.all_tokens))
 
+    @sp.offchain_view(pure = True)
+    def all_tokens_paginated(self, params):
+        """Get at most `limit` token IDs, starting from `offset`."""
+        sp.set_type(params, sp.TRecord(
+            offset = sp.TNat,
+            limit = sp.TNat
+        ).layout(("offset", "limit")))
+        end = sp.compute(sp.min(params.offset + params.limit, self.data.all_tokens))
+        sp.result(sp.range(params.offset, end))
+
+    @sp.offchain_view(pure = True)
+    def all_tokens_range(self):
+        """Get the token IDs as the interval `[start, end)`.
+
+        Token IDs are consecutive, so both bounds describe all of them.
+        """
+        sp.result(sp.record(start = sp.nat(0), end = self.data.all_tokens))
+
     @sp.offchain_view(pure = True)
     def total_supply(self, tok):
-        sp.verify(tok < self.data.max_editions, message = self.error_message.token_undefined())
+        sp.verify(tok < self.data.max_editions, message = TOKEN_UNDEFINED)
         sp.result(sp.nat(1))
 
     @sp.offchain_view(pure = True)
@@ -558,23 +641,30 @@ class FA2(FA2_token_metadata, FA2_mint, FA2_administrator, FA2_pause, FA2_lock,
                                owner = sp.TAddress,
                                operator = sp.TAddress).layout(
                                    ("owner", ("operator", "token_id"))))
-        sp.result(
-            self.operator_set.is_member(self.data.operators,
-                                        query.owner,
-                                        query.operator,
-                                        query.token_id)
-        )
+        if self.config.support_operator:
+            sp.result(
+                self.operator_set.is_member(self.data.operators,
+                                            query.owner,
+                                            query.operator,
+                                            query.token_id)
+            )
+        else:
+            sp.result(sp.bool(False))
 
     def __init__(self, config, metadata, admin):
         # Let's show off some meta-programming:
         self.all_tokens.doc = """
         This view is specified (but optional) in the standard.
+        Its reply grows with the collection, prefer `all_tokens_range` or
+        `all_tokens_paginated` for large collections.
         """
         list_of_views = [
             self.get_balance
             , self.does_token_exist
             , self.count_tokens
             , self.all_tokens
+            , self.all_tokens_paginated
+            , self.all_tokens_range
             , self.is_operator
             , self.total_supply
         ]
@@ -602,6 +692,8 @@ class FA2(FA2_token_metadata, FA2_mint, FA2_administrator, FA2_pause, FA2_lock,
                 , "sender": "owner-no-hook"
             }
         }
+        if config.support_operator and not config.operators_per_token:
+            metadata_base["permissions"]["custom"] = {"tag": "operators-per-owner"}
         self.init_metadata("metadata_base", metadata_base)
         FA2_core.__init__(self, config, metadata, paused = False, locked = False, administrator = admin)
 
@@ -618,19 +710,24 @@ class View_consumer(sp.Contract):
     def __init__(self, contract):
         self.contract = contract
         self.init(last_sum = 0,
+                  last_requests = sp.list(t = sp.TRecord(owner = sp.TAddress,
+                                                         token_id = sp.TNat)),
                   operator_support =  not contract.config.support_operator)
 
     @sp.entry_point
     def reinit(self):
         self.data.last_sum = 0
+        self.data.last_requests = []
         # It's also nice to make this contract have more than one entry point.
 
     @sp.entry_point
     def receive_balances(self, params):
-        sp.set_type(params, Balance_of.response_type())
+        sp.set_type(params, balance_of_response_type)
         self.data.last_sum = 0
+        self.data.last_requests = []
         sp.for resp in params:
             self.data.last_sum += resp.balance
+            self.data.last_requests.push(resp.request)
 
 ##
 ## ## Global Environment Parameters
@@ -649,17 +746,26 @@ def global_parameter(env_var, default):
     except:
         return default
 
-def environment_config():
-    return FA2_config(
-        debug_mode = global_parameter("debug_mode", False),
-        readable = global_parameter("readable", True),
-        force_layouts = global_parameter("force_layouts", True),
-        support_operator = global_parameter("support_operator", True),
-        allow_self_transfer = global_parameter("allow_self_transfer", False),
-        max_editions = global_parameter("max_editions", 4096),
-        price = global_parameter("price", 1000000),
-        base_uri = global_parameter("base_uri", "https://blocks-on-blocks.herokuapp.com/api/"),
-    )
+_environment_parameters = None
+
+def environment_config(**overrides):
+    global _environment_parameters
+    if _environment_parameters is None:
+        _environment_parameters = dict(
+            debug_mode = global_parameter("debug_mode", False),
+            readable = global_parameter("readable", False),
+            force_layouts = global_parameter("force_layouts", True),
+            support_operator = global_parameter("support_operator", True),
+            allow_self_transfer = global_parameter("allow_self_transfer", False),
+            operators_per_token = global_parameter("operators_per_token", True),
+            max_editions = global_parameter("max_editions", 4096),
+            price = global_parameter("price", 1000000),
+            base_uri = global_parameter("base_uri", "https://blocks-on-blocks.herokuapp.com/api/"),
+        )
+    # Tests adjust the config they get (e.g. `max_editions`), so only the
+    # environment lookups are cached and each caller gets its own instance.
+    # `overrides` force some options regardless of the environment.
+    return FA2_config(**dict(_environment_parameters, **overrides))
 
 
 @sp.add_test(name = "Basic test", is_default=True)
@@ -698,6 +804,22 @@ def tests_multi_operators():
 def tests_remove_operator():
     run_tests_remove_operator(environment_config())
 
+@sp.add_test(name = "Tests add and remove operators", is_default=True)
+def tests_add_remove_operators():
+    run_tests_add_remove_operators(environment_config())
+
+@sp.add_test(name = "Tests without operator support", is_default=True)
+def tests_no_operators():
+    run_tests_no_operators(environment_config(support_operator = False))
+
+@sp.add_test(name = "Tests operators per owner", is_default=True)
+def tests_operators_per_owner():
+    run_tests_operators_per_owner(environment_config(operators_per_token = False))
+
+@sp.add_test(name = "Tests operators per token", is_default=True)
+def tests_operators_per_token():
+    run_tests_operators_per_token(environment_config(operators_per_token = True))
+
 @sp.add_test(name = "Tests set admin", is_default=True)
 def tests_set_administrator():
     run_tests_set_administrator(environment_config())
@@ -710,6 +832,10 @@ def tests_mutez_transfer():
 def tests_get_balance():
     run_tests_get_balance(environment_config())
 
+@sp.add_test(name = "Tests balance of", is_default=True)
+def tests_balance_of():
+    run_tests_balance_of(environment_config())
+
 @sp.add_test(name = "Tests count token", is_default=True)
 def tests_count_tokens():
     run_tests_count_tokens(environment_config())
@@ -722,6 +848,14 @@ def tests_does_token_exist():
 def tests_all_tokens():
     run_tests_all_tokens(environment_config())
 
+@sp.add_test(name = "Tests all tokens paginated", is_default=True)
+def tests_all_tokens_paginated():
+    run_tests_all_tokens_paginated(environment_config())
+
+@sp.add_test(name = "Tests all tokens range", is_default=True)
+def tests_all_tokens_range():
+    run_tests_all_tokens_range(environment_config())
+
 @sp.add_test(name = "Tests is operator", is_default=True)
 def tests_is_operator():
     run_tests_is_operator(environment_config())
@@ -764,7 +898,7 @@ def add_test(config, is_default = True):
         def arguments_for_balance_of(receiver, reqs):
             return (sp.record(
                 callback = sp.contract(
-                    Balance_of.response_type(),
+                    balance_of_response_type,
                     receiver.address,
                     entry_point = "receive_balances").open_some(),
                 requests = reqs))
@@ -0,0 +1,79 @@
+def run_tests_add_remove_operators(config):
+    scenario = sp.test_scenario()
+
+    admin, [alice, bob] = get_addresses()
+    op = sp.test_account("Operator")
+
+    scenario.h1("add_operators / remove_operators tests")
+
+    scenario.table_of_contents()
+
+    #-----------------------------------------------------
+    scenario.h2("Alice adds Operator, Operator sends token to Bob")
+
+    possessors = [alice]
+    contract = create_new_contract(config, admin, scenario, possessors)
+
+    contract.add_operators([
+        contract.operator_param.make(
+            owner=alice.address,
+            operator=op.address,
+            token_id=0)
+    ]).run(sender=alice)
+
+    contract.transfer([
+        contract.batch_transfer.item(from_=alice.address,
+                               txs=[
+                                   sp.record(to_=bob.address, amount=1, token_id=0)
+                               ])
+    ]).run(sender=op)
+    possessors[0] = bob
+    ownership_test(scenario, contract, possessors)
+
+    #-----------------------------------------------------
+    scenario.h2("Removed operator has no right on token anymore")
+
+    possessors = [alice]
+    contract = create_new_contract(config, admin, scenario, possessors)
+
+    contract.add_operators([
+        contract.operator_param.make(
+            owner=alice.address,
+            operator=op.address,
+            token_id=0)
+    ]).run(sender=alice)
+
+    contract.remove_operators([
+        contract.operator_param.make(
+            owner=alice.address,
+            operator=op.address,
+            token_id=0)
+    ]).run(sender=alice)
+
+    contract.transfer([
+        contract.batch_transfer.item(from_=alice.address,
+                               txs=[
+                                   sp.record(to_=bob.address, amount=1, token_id=0)
+                               ])
+    ]).run(sender=op, valid=False)
+    ownership_test(scenario, contract, possessors)
+
+    #-----------------------------------------------------
+    scenario.h2("Granting in the name of someone else")
+
+    possessors = [alice]
+    contract = create_new_contract(config, admin, scenario, possessors)
+
+    contract.add_operators([
+        contract.operator_param.make(
+            owner=alice.address,
+            operator=op.address,
+            token_id=0)
+    ]).run(sender=bob, valid=False)
+
+    contract.remove_operators([
+        contract.operator_param.make(
+            owner=alice.address,
+            operator=op.address,
+            token_id=0)
+    ]).run(sender=bob, valid=False)
@@ -29,3 +29,64 @@ def run_tests_all_tokens(config):
 
     all_tokens = contract.all_tokens()
     scenario.verify(all_tokens == sp.range(0, 2))
+
+def run_tests_all_tokens_paginated(config):
+    scenario = sp.test_scenario()
+
+    admin, [alice, bob] = get_addresses()
+
+    scenario.h1("Tests all_tokens_paginated")
+
+    scenario.table_of_contents()
+
+    #-----------------------------------------------------
+    scenario.h2("No token")
+
+    contract = create_new_contract(config, admin, scenario, [])
+
+    page = contract.all_tokens_paginated(sp.record(offset=0, limit=10))
+    scenario.verify_equal(page, [])
+
+    #-----------------------------------------------------
+    scenario.h2("Page smaller than the collection")
+
+    contract = create_new_contract(config, admin, scenario, [alice, bob, alice])
+
+    page = contract.all_tokens_paginated(sp.record(offset=0, limit=2))
+    scenario.verify_equal(page, [0, 1])
+
+    page = contract.all_tokens_paginated(sp.record(offset=2, limit=2))
+    scenario.verify_equal(page, [2])
+
+    #-----------------------------------------------------
+    scenario.h2("Offset past the last token")
+
+    contract = create_new_contract(config, admin, scenario, [alice])
+
+    page = contract.all_tokens_paginated(sp.record(offset=5, limit=2))
+    scenario.verify_equal(page, [])
+
+def run_tests_all_tokens_range(config):
+    scenario = sp.test_scenario()
+
+    admin, [alice, bob] = get_addresses()
+
+    scenario.h1("Tests all_tokens_range")
+
+    #-----------------------------------------------------
+    scenario.h2("No token")
+
+    contract = create_new_contract(config, admin, scenario, [])
+
+    all_tokens = contract.all_tokens_range()
+    scenario.verify(all_tokens.start == 0)
+    scenario.verify(all_tokens.end == 0)
+
+    #-----------------------------------------------------
+    scenario.h2("Two tokens")
+
+    contract = create_new_contract(config, admin, scenario, [alice, bob])
+
+    all_tokens = contract.all_tokens_range()
+    scenario.verify(all_tokens.start == 0)
+    scenario.verify(all_tokens.end == 2)
@@ -0,0 +1,56 @@
+def run_tests_balance_of(config):
+    scenario = sp.test_scenario()
+
+    admin, [alice, bob] = get_addresses()
+
+    scenario.h1("Tests balance of")
+
+    scenario.table_of_contents()
+
+    contract = create_new_contract(config, admin, scenario, [alice, bob])
+    consumer = View_consumer(contract)
+    scenario += consumer
+
+    def balance_of_args(requests):
+        return sp.record(
+            callback = sp.contract(
+                balance_of_response_type,
+                consumer.address,
+                entry_point = "receive_balances").open_some(),
+            requests = requests)
+
+    #-----------------------------------------------------
+    scenario.h2("Balance of possessed token")
+    contract.balance_of(balance_of_args([
+        sp.record(owner = alice.address, token_id = 0)
+    ])).run(sender = alice)
+    scenario.verify(consumer.data.last_sum == 1)
+
+    #-----------------------------------------------------
+    scenario.h2("Balance of non-possessed token")
+    contract.balance_of(balance_of_args([
+        sp.record(owner = alice.address, token_id = 1)
+    ])).run(sender = alice)
+    scenario.verify(consumer.data.last_sum == 0)
+
+    #-----------------------------------------------------
+    scenario.h2("Balance of several tokens")
+    contract.balance_of(balance_of_args([
+        sp.record(owner = alice.address, token_id = 0),
+        sp.record(owner = alice.address, token_id = 1),
+        sp.record(owner = bob.address, token_id = 1)
+    ])).run(sender = alice)
+    scenario.verify(consumer.data.last_sum == 2)
+
+    scenario.p("Each response echoes its request")
+    scenario.verify_equal(consumer.data.last_requests, [
+        sp.record(owner = bob.address, token_id = 1),
+        sp.record(owner = alice.address, token_id = 1),
+        sp.record(owner = alice.address, token_id = 0)
+    ])
+
+    #-----------------------------------------------------
+    scenario.h2("Balance of undefined token")
+    contract.balance_of(balance_of_args([
+        sp.record(owner = alice.address, token_id = 2)
+    ])).run(sender = alice, valid = False, exception = TOKEN_UNDEFINED)
@@ -21,7 +21,7 @@ def run_basic_test(config):
 
     scenario.h2("Mint")
     minted = c1.mint(1).run(sender=alice, amount=sp.mutez(1000000))
-    scenario.verify(c1.data.ledger[0] == alice.address)
+    scenario.verify(c1.data.tokens[0].owner == alice.address)
 
     scenario.h2("Set base URI")
     resultingUri = c1.token_metadata(0).token_info['']
@@ -33,8 +33,8 @@ def run_basic_test(config):
 
     scenario.h2("Test ledger")
     c1.mint(1).run(sender=alice, amount=sp.mutez(1000000))
-    scenario.verify(c1.data.ledger[0] == alice.address)
-    scenario.verify(c1.data.ledger[1] == alice.address)
+    scenario.verify(c1.data.tokens[0].owner == alice.address)
+    scenario.verify(c1.data.tokens[1].owner == alice.address)
 
     scenario.h2("Mint when max number of token reached")
     c1.mint(1).run(sender=alice, amount=sp.mutez(1000000), valid=False)
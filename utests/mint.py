@@ -13,10 +13,10 @@ def run_mint_test(config):
     scenario.h2("Single minting")
     scenario.h3("Mint 1 token from non-admin (OK)")
     c1.mint(1).run(sender=alice, amount=sp.mutez(config.price))
-    scenario.verify(c1.data.ledger[0] == alice.address)
+    scenario.verify(c1.data.tokens[0].owner == alice.address)
     scenario.h3("Mint 1 token from admin (OK)")
     c1.mint(1).run(sender=admin, amount=sp.mutez(config.price))
-    scenario.verify(c1.data.ledger[1] == admin.address)
+    scenario.verify(c1.data.tokens[1].owner == admin.address)
 
     scenario.h2("Negative minting")
     scenario.h3("Mint -1 tokens from non-admin (KO)")
@@ -34,11 +34,11 @@ def run_mint_test(config):
     scenario.h3("Mint 3 tokens from non-admin (OK)")
     c1.mint(3).run(sender=alice, amount=sp.mutez(config.price * 3))
     for i in range(2, 5):
-        scenario.verify(c1.data.ledger[i] == alice.address)
+        scenario.verify(c1.data.tokens[i].owner == alice.address)
     scenario.h3("Mint 11 tokens from non-admin (OK)")
     c1.mint(11).run(sender=alice, amount=sp.mutez(config.price * 11))
     for i in range(5, 16):
-        scenario.verify(c1.data.ledger[i] == alice.address)
+        scenario.verify(c1.data.tokens[i].owner == alice.address)
 
     if (config.price > 0):
         scenario.h2("Incoherent amount (0)")
@@ -76,10 +76,10 @@ def run_mint_test(config):
     c1.set_pause(False).run(sender=admin)
     scenario.h3("Mint 1 token from non-admin (OK)")
     c1.mint(1).run(sender=alice, amount=sp.mutez(config.price))
-    scenario.verify(c1.data.ledger[16] == alice.address)
+    scenario.verify(c1.data.tokens[16].owner == alice.address)
     scenario.h3("Mint 1 token from admin (OK)")
     c1.mint(1).run(sender=admin, amount=sp.mutez(config.price))
-    scenario.verify(c1.data.ledger[17] == admin.address)
+    scenario.verify(c1.data.tokens[17].owner == admin.address)
 
     scenario.h2("Max editions reached (new contract with max_editions=1)")
     config.max_editions = 1
@@ -99,7 +99,7 @@ def run_mint_test(config):
     scenario.h3("Mint until max is reached")
     scenario.h4("Mint 1 token from non-admin (OK)")
     c2.mint(1).run(sender=alice, amount=sp.mutez(config.price))
-    scenario.verify(c1.data.ledger[0] == alice.address)
+    scenario.verify(c1.data.tokens[0].owner == alice.address)
 
     scenario.h3("Mint 1 token after max is reached")
     scenario.h4("Mint 1 token from non-admin (KO)")
@@ -0,0 +1,68 @@
+def run_tests_no_operators(config):
+    scenario = sp.test_scenario()
+
+    admin, [alice, bob] = get_addresses()
+    op = sp.test_account("Operator")
+
+    scenario.h1("Contract without operator support")
+
+    scenario.table_of_contents()
+
+    #-----------------------------------------------------
+    scenario.h2("Owner can transfer its token")
+
+    possessors = [alice]
+    contract = create_new_contract(config, admin, scenario, possessors)
+
+    contract.transfer([
+        contract.batch_transfer.item(from_=alice.address,
+                               txs=[
+                                   sp.record(to_=bob.address, amount=1, token_id=0)
+                               ])
+    ]).run(sender=alice)
+    possessors[0] = bob
+    ownership_test(scenario, contract, possessors)
+
+    #-----------------------------------------------------
+    scenario.h2("Operators cannot be added")
+
+    possessors = [alice]
+    contract = create_new_contract(config, admin, scenario, possessors)
+
+    contract.update_operators([
+        sp.variant("add_operator", contract.operator_param.make(
+            owner=alice.address,
+            operator=op.address,
+            token_id=0))
+    ]).run(sender=alice, valid=False, exception=OPERATORS_UNSUPPORTED)
+
+    contract.add_operators([
+        contract.operator_param.make(
+            owner=alice.address,
+            operator=op.address,
+            token_id=0)
+    ]).run(sender=alice, valid=False, exception=OPERATORS_UNSUPPORTED)
+
+    contract.remove_operators([
+        contract.operator_param.make(
+            owner=alice.address,
+            operator=op.address,
+            token_id=0)
+    ]).run(sender=alice, valid=False, exception=OPERATORS_UNSUPPORTED)
+
+    scenario.h3("Nobody is an operator")
+
+    is_op = contract.is_operator(
+        sp.record(owner=alice.address, operator=op.address, token_id=0)
+    )
+    scenario.verify(is_op == False)
+
+    scenario.h3("Only the owner can transfer")
+
+    contract.transfer([
+        contract.batch_transfer.item(from_=alice.address,
+                               txs=[
+                                   sp.record(to_=bob.address, amount=1, token_id=0)
+                               ])
+    ]).run(sender=op, valid=False)
+    ownership_test(scenario, contract, possessors)
@@ -0,0 +1,150 @@
+def run_tests_operators_per_owner(config):
+    scenario = sp.test_scenario()
+
+    admin, [alice, bob] = get_addresses()
+    op = sp.test_account("Operator")
+
+    scenario.h1("Operators granted per owner (operators_per_token = False)")
+
+    scenario.table_of_contents()
+
+    #-----------------------------------------------------
+    scenario.h2("Granting on token 0 lets Operator transfer token 1")
+
+    possessors = [alice]*2
+    contract = create_new_contract(config, admin, scenario, possessors)
+
+    contract.update_operators([
+        sp.variant("add_operator", contract.operator_param.make(
+            owner=alice.address,
+            operator=op.address,
+            token_id=0))
+    ]).run(sender=alice)
+
+    is_op = contract.is_operator(
+        sp.record(owner=alice.address, operator=op.address, token_id=1)
+    )
+    scenario.verify(is_op == True)
+
+    contract.transfer([
+        contract.batch_transfer.item(from_=alice.address,
+                               txs=[
+                                   sp.record(to_=bob.address, amount=1, token_id=1)
+                               ])
+    ]).run(sender=op)
+    possessors[1] = bob
+    ownership_test(scenario, contract, possessors)
+
+    #-----------------------------------------------------
+    scenario.h2("Removing on token 0 revokes token 1 as well")
+
+    possessors = [alice]*2
+    contract = create_new_contract(config, admin, scenario, possessors)
+
+    contract.update_operators([
+        sp.variant("add_operator", contract.operator_param.make(
+            owner=alice.address,
+            operator=op.address,
+            token_id=1))
+    ]).run(sender=alice)
+
+    contract.update_operators([
+        sp.variant("remove_operator", contract.operator_param.make(
+            owner=alice.address,
+            operator=op.address,
+            token_id=0))
+    ]).run(sender=alice)
+
+    contract.transfer([
+        contract.batch_transfer.item(from_=alice.address,
+                               txs=[
+                                   sp.record(to_=bob.address, amount=1, token_id=1)
+                               ])
+    ]).run(sender=op, valid=False)
+    ownership_test(scenario, contract, possessors)
+
+def run_tests_operators_per_token(config):
+    scenario = sp.test_scenario()
+
+    admin, [alice, bob] = get_addresses()
+    op = sp.test_account("Operator")
+
+    scenario.h1("Operators granted per token (operators_per_token = True)")
+
+    scenario.table_of_contents()
+
+    #-----------------------------------------------------
+    scenario.h2("Granting on token 0 does not let Operator transfer token 1")
+
+    possessors = [alice]*2
+    contract = create_new_contract(config, admin, scenario, possessors)
+
+    contract.update_operators([
+        sp.variant("add_operator", contract.operator_param.make(
+            owner=alice.address,
+            operator=op.address,
+            token_id=0))
+    ]).run(sender=alice)
+
+    is_op = contract.is_operator(
+        sp.record(owner=alice.address, operator=op.address, token_id=1)
+    )
+    scenario.verify(is_op == False)
+
+    contract.transfer([
+        contract.batch_transfer.item(from_=alice.address,
+                               txs=[
+                                   sp.record(to_=bob.address, amount=1, token_id=1)
+                               ])
+    ]).run(sender=op, valid=False)
+    ownership_test(scenario, contract, possessors)
+
+    contract.transfer([
+        contract.batch_transfer.item(from_=alice.address,
+                               txs=[
+                                   sp.record(to_=bob.address, amount=1, token_id=0)
+                               ])
+    ]).run(sender=op)
+    possessors[0] = bob
+    ownership_test(scenario, contract, possessors)
+
+    #-----------------------------------------------------
+    scenario.h2("Removing on token 1 keeps rights on token 0")
+
+    possessors = [alice]*2
+    contract = create_new_contract(config, admin, scenario, possessors)
+
+    contract.update_operators([
+        sp.variant("add_operator", contract.operator_param.make(
+            owner=alice.address,
+            operator=op.address,
+            token_id=0)),
+        sp.variant("add_operator", contract.operator_param.make(
+            owner=alice.address,
+            operator=op.address,
+            token_id=1))
+    ]).run(sender=alice)
+
+    contract.update_operators([
+        sp.variant("remove_operator", contract.operator_param.make(
+            owner=alice.address,
+            operator=op.address,
+            token_id=1))
+    ]).run(sender=alice)
+
+    contract.transfer([
+        contract.batch_transfer.item(from_=alice.address,
+                               txs=[
+                                   sp.record(to_=bob.address, amount=1, token_id=1)
+                               ])
+    ]).run(sender=op, valid=False)
+    ownership_test(scenario, contract, possessors)
+
+    contract.transfer([
+        contract.batch_transfer.item(from_=alice.address,
+                               txs=[
+                                   sp.record(to_=bob.address, amount=1, token_id=0)
+                               ])
+    ]).run(sender=op)
+    possessors[0] = bob
+    ownership_test(scenario, contract, possessors)
@@ -28,7 +28,7 @@ def run_tests_pause(config):
 
     scenario.h3("Mint without pause")
     minted = contract.mint(1).run(sender=alice, amount=sp.mutez(1000000))
-    scenario.verify(contract.data.ledger[0] == alice.address)
+    scenario.verify(contract.data.tokens[0].owner == alice.address)
 
     contract.set_pause(True).run(sender=admin)
 
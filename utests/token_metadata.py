@@ -13,6 +13,17 @@ def run_token_metadata(config):
 
     scenario.show(contract.token_metadata(0))
 
+    #-----------------------------------------------------
+    scenario.h2("Token URI of multi-digit token IDs")
+    config.max_editions = 10000
+    contract = create_new_contract(config, admin, scenario, [])
+    contract.mint(1006).run(sender=alice, amount=sp.mutez(config.price * 1006))
+
+    for token_id in [0, 9, 10, 99, 100, 1005]:
+        resultingUri = contract.token_metadata(token_id).token_info['']
+        scenario.verify(resultingUri == sp.utils.bytes_of_string(
+            config.base_uri + str(token_id)))
+
     #-----------------------------------------------------
     scenario.h2("Get non-existing token metadata")
     contract = create_new_contract(config, admin, scenario, [])
@@ -21,7 +21,7 @@ def ownership_test(scenario, contract, ledgers, quiet=False):
     if not quiet:
         scenario.p("Tokens ownership test")
     for i in range(len(ledgers)):
-        scenario.verify(contract.data.ledger[i] == ledgers[i].address)
+        scenario.verify(contract.data.tokens[i].owner == ledgers[i].address)
 
 def set_and_test_base_uri(stringUrl, scenario, contract, sender, valid = True):
     url = sp.bytes('0x' + ''.join([hex(ord(c))[2:] for c in stringUrl]))